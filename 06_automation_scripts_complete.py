@@ -5,19 +5,41 @@ automation/blog_automation.py
 """
 
 import os
+import re
 import sys
 import yaml
 import json
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import shlex
 import subprocess
 import logging
+import threading
+import time
+from collections import Counter
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Iterator, Tuple
 import hashlib
+import stat
+from fnmatch import fnmatchcase
 import shutil
-from PIL import Image
-import markdown
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from functools import lru_cache, partial
+
+# LibYAML C 바인딩이 있으면 사용 (순수 Python 로더 대비 약 10배 빠름)
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+# orjson이 있으면 JSON 직렬화/파싱에 사용 (C 구현, 표준 json 대비 수 배 빠름)
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # 로깅 설정
 logging.basicConfig(
@@ -30,9 +52,248 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+SITEMAP_URL_TAG = '{http://www.sitemaps.org/schemas/sitemap/0.9}url'
+
+# 마크다운 링크 [텍스트](URL)
+_MD_LINK_RE = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
+
+
+def _yload(stream) -> Any:
+    """YAML 문자열/스트림 파싱 (SafeLoader)"""
+    return yaml.load(stream, Loader=SafeLoader)
+
+
+def _read_json(path) -> Any:
+    """JSON 파일 로드"""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _write_json(path, data: Any) -> None:
+    """JSON 보고서 저장 (들여쓰기 2칸, 비ASCII 문자 그대로)
+    
+    임시 파일에 쓴 뒤 os.replace로 교체하므로 읽는 쪽에서 반쯤 쓰인 파일을 보지 않음
+    """
+    tmp_path = f"{os.fspath(path)}.tmp"
+    
+    if orjson is not None:
+        with open(tmp_path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str))
+    else:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+    
+    os.replace(tmp_path, path)
+
+
+def _png_has_alpha(path: str) -> Optional[bool]:
+    """PNG IHDR 헤더의 color type으로 알파 채널 여부 확인 (PNG가 아니면 None)"""
+    with open(path, 'rb') as f:
+        header = f.read(33)
+    
+    if len(header) < 26 or not header.startswith(b'\x89PNG\r\n\x1a\n') or header[12:16] != b'IHDR':
+        return None
+    
+    # color type 4: 그레이스케일+알파, 6: RGBA
+    return header[25] in (4, 6)
+
+
+def _iter_files(root) -> Iterator[os.DirEntry]:
+    """root 아래 모든 파일의 DirEntry를 재귀적으로 반환 (심볼릭 링크 디렉토리는 따라가지 않음)
+    
+    Path.rglob와 달리 항목마다 Path 객체를 만들지 않고, DirEntry가 캐시한
+    파일 종류와 stat 결과를 호출자가 그대로 재사용할 수 있음
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file():
+                    yield entry
+
+
+class StatCache:
+    """자동화 실행 1회 동안 os.stat 결과를 경로별로 기억하는 캐시
+    
+    존재하지 않는 경로도 기억하며, 파일을 쓰는 작업 뒤에는 invalidate로 해당 경로 아래 항목을 비움
+    """
+    
+    def __init__(self):
+        self._entries: Dict[str, Optional[os.stat_result]] = {}
+        self._lock = threading.Lock()
+    
+    def stat(self, path) -> os.stat_result:
+        """캐시된 stat 결과 - 경로가 없으면 FileNotFoundError"""
+        key = os.fspath(path)
+        try:
+            result = self._entries[key]
+        except KeyError:
+            try:
+                result = os.stat(key)
+            except FileNotFoundError:
+                result = None
+            with self._lock:
+                self._entries[key] = result
+        
+        if result is None:
+            raise FileNotFoundError(key)
+        return result
+    
+    def exists(self, path) -> bool:
+        try:
+            self.stat(path)
+            return True
+        except FileNotFoundError:
+            return False
+    
+    def invalidate(self, path) -> None:
+        """path 자신과 그 아래 경로의 캐시 항목 제거"""
+        key = os.fspath(path)
+        prefix = os.path.join(key, '')
+        with self._lock:
+            for cached in [k for k in self._entries if k == key or k.startswith(prefix)]:
+                del self._entries[cached]
+
+
+def _fast_copy2(src, dst) -> None:
+    """shutil.copy2와 같지만 데이터 복사를 os.sendfile로 커널 안에서 처리
+    
+    sendfile을 쓸 수 없는 플랫폼/파일이면 shutil.copy2로 대체
+    """
+    if not hasattr(os, 'sendfile'):
+        shutil.copy2(src, dst)
+        return
+    
+    try:
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            remaining = os.fstat(fsrc.fileno()).st_size
+            offset = 0
+            while remaining > 0:
+                sent = os.sendfile(fdst.fileno(), fsrc.fileno(), offset, remaining)
+                if sent == 0:
+                    break
+                offset += sent
+                remaining -= sent
+    except OSError:
+        shutil.copy2(src, dst)
+        return
+    
+    shutil.copystat(src, dst)
+
+
+def _link_or_copy(src: str, dst: str, src_stat: os.stat_result, reference: Optional[str] = None) -> None:
+    """기준 백업의 같은 파일이 원본과 동일하면(크기, mtime) 하드링크, 아니면 복사
+    
+    rsync --link-dest 방식 - 원본이 아닌 이전 백업에 링크하므로 원본을 수정해도 백업은 바뀌지 않음
+    """
+    if reference is not None:
+        try:
+            ref_stat = os.stat(reference)
+            if ref_stat.st_size == src_stat.st_size and ref_stat.st_mtime_ns == src_stat.st_mtime_ns:
+                os.link(reference, dst)
+                return
+        except OSError:
+            # 기준 파일 없음, 다른 파일시스템(EXDEV) 등 → 일반 복사
+            pass
+    
+    _fast_copy2(src, dst)
+
+
+def _copy_tree(src, dst, reference=None) -> int:
+    """디렉토리 트리를 복사하고 복사한 파일 크기 합계(바이트) 반환
+    
+    os.scandir의 DirEntry로 순회하여 파일 종류 확인에 추가 stat이 없고,
+    크기는 복사와 같은 순회에서 합산함. reference(이전 백업의 같은 디렉토리)가
+    주어지면 변경되지 않은 파일은 하드링크로 처리
+    """
+    total_bytes = 0
+    copied_dirs = []
+    stack = [(os.fspath(src), os.fspath(dst), os.fspath(reference) if reference else None)]
+    
+    while stack:
+        src_dir, dst_dir, ref_dir = stack.pop()
+        os.makedirs(dst_dir, exist_ok=True)
+        copied_dirs.append((src_dir, dst_dir))
+        
+        with os.scandir(src_dir) as it:
+            for entry in it:
+                dst_path = os.path.join(dst_dir, entry.name)
+                ref_path = os.path.join(ref_dir, entry.name) if ref_dir else None
+                if entry.is_dir():
+                    stack.append((entry.path, dst_path, ref_path))
+                else:
+                    entry_stat = entry.stat()
+                    _link_or_copy(entry.path, dst_path, entry_stat, ref_path)
+                    total_bytes += entry_stat.st_size
+    
+    # 디렉토리 메타데이터는 내용을 모두 복사한 뒤 설정 (shutil.copytree와 동일)
+    for src_dir, dst_dir in reversed(copied_dirs):
+        shutil.copystat(src_dir, dst_dir)
+    
+    return total_bytes
+
+
+def _optimize_one(path: str, quality: int) -> Dict[str, Any]:
+    """이미지 한 장 최적화 (프로세스 풀 작업 단위)"""
+    # Pillow는 로딩 비용이 커서 이미지 작업 시점에 import
+    from PIL import Image
+    
+    result: Dict[str, Any] = {'path': path, 'size_before': 0}
+    
+    try:
+        result['size_before'] = os.path.getsize(path)
+        
+        # 이미지 최적화
+        with Image.open(path) as img:
+            # EXIF 데이터 제거 및 최적화
+            if img.mode in ('RGBA', 'LA'):
+                # PNG로 저장 (투명도 유지)
+                img.save(path, 'PNG', optimize=True)
+            else:
+                # JPEG로 저장
+                if img.mode != 'RGB':
+                    img = img.convert('RGB')
+                img.save(path, 'JPEG', quality=quality, optimize=True)
+        
+        result['size_after'] = os.path.getsize(path)
+    except Exception as e:
+        result['error'] = str(e)
+    
+    return result
+
+
 class BlogAutomation:
     """블로그 자동화 메인 클래스"""
     
+    # 파일 선두의 YAML front matter 블록
+    _FM_RE = re.compile(rb'\A---\r?\n(.*?)\r?\n---[ \t]*(?:\r?\n|\Z)', re.DOTALL)
+    
+    # 본문 단어 (공백으로 구분된 토큰)
+    _WORD_RE = re.compile(rb'\S+')
+    
+    # 메타 태그 / 구조화 데이터 표식 (HTML을 한 번만 훑어 확인)
+    _META_RE = re.compile(
+        rb'(?P<has_title><title>)'
+        rb'|(?P<has_description>name="description")'
+        rb'|(?P<has_keywords>name="keywords")'
+        rb'|(?P<has_og_tags>property="og:)'
+        rb'|(?P<has_twitter_cards>name="twitter:)'
+        rb'|(?P<has_canonical>rel="canonical")'
+        rb'|(?P<has_json_ld>application/ld\+json)'
+        rb'|(?P<has_microdata>itemscope)'
+        rb'|(?P<has_rdfa>typeof=)'
+    )
+    
+    # 분석 대상 이미지 확장자 (점 제외, 소문자)
+    _IMAGE_EXTS = frozenset({'jpg', 'jpeg', 'png', 'gif', 'webp'})
+    _OPTIMIZABLE_EXTS = frozenset({'jpg', 'jpeg', 'png'})
+    
     def __init__(self, config_path: str = "_config.yml"):
         self.config_path = config_path
         self.site_config = self.load_site_config()
@@ -41,6 +302,22 @@ class BlogAutomation:
         self.repo_name = 'jkimjoon70.github.io'
         self.site_url = 'https://jkimjoon70.github.io'
         
+        # HTTP 세션 (keep-alive로 TLS 핸드셰이크 재사용)
+        self.http = requests.Session()
+        self.http.mount('https://', HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(total=2, backoff_factor=0.2)
+        ))
+        
+        # 건강 점검 중 홈페이지 응답 캐시 (GET 1회를 여러 점검이 공유)
+        self._homepage: Optional[requests.Response] = None
+        self._homepage_time_ms: float = 0.0
+        self._homepage_lock = threading.Lock()
+        
+        # 건강 점검 1회 동안 공유하는 타임스탬프
+        self._run_iso: Optional[str] = None
+        
         # 디렉토리 설정
         self.base_dir = Path('.')
         self.posts_dir = self.base_dir / '_posts'
@@ -48,17 +325,30 @@ class BlogAutomation:
         self.images_dir = self.assets_dir / 'images'
         self.automation_dir = self.base_dir / 'automation'
         
+        # 실행 중 반복되는 존재 확인/stat 호출 캐시
+        self._stat_cache = StatCache()
+        
+        # 포스트 파싱 캐시: 경로 -> (mtime, front matter, 본문)
+        self._post_cache: Dict[Path, Tuple[float, Optional[Dict[str, Any]], Optional[bytes]]] = {}
+        
         # 디렉토리 생성
         self.automation_dir.mkdir(exist_ok=True)
         self.images_dir.mkdir(parents=True, exist_ok=True)
         
         logger.info("🤖 Blog Automation initialized")
 
+    @staticmethod
+    @lru_cache(maxsize=4)
+    def _load_config_cached(path: str, mtime_ns: int) -> Dict[str, Any]:
+        """설정 파일 파싱 결과를 (경로, mtime) 기준으로 캐시"""
+        with open(path, 'r', encoding='utf-8') as f:
+            return _yload(f)
+
     def load_site_config(self) -> Dict[str, Any]:
         """Jekyll 설정 파일 로드"""
         try:
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f)
+            mtime_ns = os.stat(self.config_path).st_mtime_ns
+            config = self._load_config_cached(self.config_path, mtime_ns)
             logger.info("✅ Site configuration loaded")
             return config
         except FileNotFoundError:
@@ -72,16 +362,33 @@ class BlogAutomation:
         """사이트 상태 종합 점검"""
         logger.info("🏥 Starting comprehensive site health check...")
         
-        health_report = {
-            'timestamp': datetime.now().isoformat(),
-            'site_availability': self.check_site_availability(),
-            'performance': self.check_site_performance(),
-            'seo_health': self.check_seo_health(),
-            'content_integrity': self.check_content_integrity(),
-            'security_scan': self.check_security(),
-            'build_status': self.check_build_status()
+        self._run_iso = datetime.now().isoformat()
+        health_report = {'timestamp': self._run_iso}
+        
+        # Lighthouse 성능 점수는 로컬 CPU 경합에 민감하므로 다른 점검과 겹치지 않게 먼저 단독 실행
+        logger.info("⚡ Analyzing site performance...")
+        lighthouse_score = self.run_lighthouse_audit()
+        
+        sub_checks = {
+            'site_availability': self.check_site_availability,
+            'performance': partial(self._site_performance, lighthouse_score),
+            'seo_health': self.check_seo_health,
+            'content_integrity': self.check_content_integrity,
+            'security_scan': self.check_security,
+            'build_status': self.check_build_status
         }
         
+        # 각 점검은 네트워크/서브프로세스 대기가 대부분이므로 동시에 실행
+        self._homepage = None
+        try:
+            with ThreadPoolExecutor(max_workers=len(sub_checks)) as executor:
+                futures = {name: executor.submit(check) for name, check in sub_checks.items()}
+                for name, future in futures.items():
+                    health_report[name] = future.result()
+        finally:
+            self._homepage = None
+            self._run_iso = None
+        
         # 건강도 점수 계산
         health_report['overall_score'] = self.calculate_health_score(health_report)
         
@@ -91,37 +398,52 @@ class BlogAutomation:
         logger.info(f"🎯 Overall health score: {health_report['overall_score']}/100")
         return health_report
 
+    def _now_iso(self) -> str:
+        """현재 점검 실행의 타임스탬프 (점검 밖에서는 현재 시각)"""
+        return self._run_iso or datetime.now().isoformat()
+
+    def _get_homepage(self) -> requests.Response:
+        """홈페이지 응답 조회 (점검 중에는 한 번만 요청)"""
+        with self._homepage_lock:
+            if self._homepage is None:
+                start_ns = time.perf_counter_ns()
+                response = self.http.get(self.site_url, timeout=10)
+                
+                self._homepage_time_ms = (time.perf_counter_ns() - start_ns) / 1e6
+                self._homepage = response
+            
+            return self._homepage
+
     def check_site_availability(self) -> Dict[str, Any]:
         """사이트 접근성 확인"""
         try:
-            start_time = datetime.now()
-            response = requests.get(self.site_url, timeout=10)
-            end_time = datetime.now()
-            
-            response_time = (end_time - start_time).total_seconds() * 1000
+            response = self._get_homepage()
             
             return {
                 'status': 'online' if response.status_code == 200 else 'issues',
                 'status_code': response.status_code,
-                'response_time_ms': round(response_time, 2),
+                'response_time_ms': round(self._homepage_time_ms, 2),
                 'headers': dict(response.headers),
                 'ssl_valid': response.url.startswith('https://'),
-                'timestamp': datetime.now().isoformat()
+                'timestamp': self._now_iso()
             }
         except requests.RequestException as e:
             logger.error(f"❌ Site availability check failed: {e}")
             return {
                 'status': 'offline',
                 'error': str(e),
-                'timestamp': datetime.now().isoformat()
+                'timestamp': self._now_iso()
             }
 
     def check_site_performance(self) -> Dict[str, Any]:
         """사이트 성능 분석"""
         logger.info("⚡ Analyzing site performance...")
-        
+        return self._site_performance(self.run_lighthouse_audit())
+
+    def _site_performance(self, lighthouse_score: Optional[int]) -> Dict[str, Any]:
+        """Lighthouse 점수를 받아 나머지 성능 항목 분석"""
         performance_data = {
-            'lighthouse_score': self.run_lighthouse_audit(),
+            'lighthouse_score': lighthouse_score,
             'page_size': self.analyze_page_size(),
             'load_time_history': self.get_load_time_history(),
             'optimization_suggestions': []
@@ -147,10 +469,9 @@ class BlogAutomation:
             result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
             
             if result.returncode == 0 and os.path.exists('automation/lighthouse-report.json'):
-                with open('automation/lighthouse-report.json', 'r') as f:
-                    report = json.load(f)
-                    performance_score = report.get('lhr', {}).get('categories', {}).get('performance', {}).get('score', 0)
-                    return int(performance_score * 100) if performance_score else None
+                report = _read_json('automation/lighthouse-report.json')
+                performance_score = report.get('lhr', {}).get('categories', {}).get('performance', {}).get('score', 0)
+                return int(performance_score * 100) if performance_score else None
             
         except (subprocess.TimeoutExpired, FileNotFoundError, json.JSONDecodeError) as e:
             logger.warning(f"⚠️ Lighthouse audit failed: {e}")
@@ -160,16 +481,16 @@ class BlogAutomation:
     def analyze_page_size(self) -> Dict[str, Any]:
         """페이지 크기 분석"""
         try:
-            response = requests.get(self.site_url)
+            # 홈페이지 본문은 다른 점검과 공유하는 응답을 재사용
+            response = self._get_homepage()
             html_size = len(response.content)
             
-            # CSS 파일 크기 확인
+            # CSS 파일 크기 확인 (본문을 내려받지 않고 HEAD로 확인)
             css_size = 0
             css_files = self.find_css_files()
             for css_file in css_files:
                 try:
-                    css_response = requests.get(f"{self.site_url}/{css_file}")
-                    css_size += len(css_response.content)
+                    css_size += self._get_remote_size(f"{self.site_url}/{css_file}")
                 except:
                     pass
             
@@ -182,6 +503,22 @@ class BlogAutomation:
             logger.error(f"❌ Page size analysis failed: {e}")
             return {}
 
+    def _get_remote_size(self, url: str, max_bytes: int = 10 * 1024 * 1024) -> int:
+        """원격 파일 크기 - Content-Length 헤더 우선, 없으면 스트리밍으로 계산 (max_bytes에서 중단)"""
+        response = self.http.head(url, timeout=10, allow_redirects=True)
+        content_length = response.headers.get('Content-Length', '')
+        if content_length.isdigit():
+            return int(content_length)
+        
+        size = 0
+        with self.http.get(url, stream=True, timeout=10) as response:
+            for chunk in response.iter_content(chunk_size=65536):
+                size += len(chunk)
+                if size >= max_bytes:
+                    break
+        
+        return size
+
     def find_css_files(self) -> List[str]:
         """CSS 파일 목록 찾기"""
         css_files = []
@@ -226,22 +563,30 @@ class BlogAutomation:
         sitemap_url = f"{self.site_url}/sitemap.xml"
         
         try:
-            response = requests.get(sitemap_url)
-            if response.status_code == 200:
-                # XML 파싱하여 URL 개수 확인
-                import xml.etree.ElementTree as ET
-                root = ET.fromstring(response.content)
-                url_count = len(root.findall('.//{http://www.sitemaps.org/schemas/sitemap/0.9}url'))
+            with self.http.get(sitemap_url, stream=True) as response:
+                if response.status_code != 200:
+                    return {'exists': False, 'status_code': response.status_code}
+                
+                # XML을 스트리밍 파싱하여 URL 개수 확인 (트리를 메모리에 유지하지 않음)
+                parser = ET.XMLPullParser(events=('end',))
+                url_count = 0
+                size = 0
+                for chunk in response.iter_content(chunk_size=65536):
+                    size += len(chunk)
+                    parser.feed(chunk)
+                    for _, elem in parser.read_events():
+                        if elem.tag == SITEMAP_URL_TAG:
+                            url_count += 1
+                            elem.clear()
+                parser.close()
                 
                 return {
                     'exists': True,
                     'accessible': True,
                     'url_count': url_count,
                     'last_modified': response.headers.get('Last-Modified'),
-                    'size_kb': round(len(response.content) / 1024, 2)
+                    'size_kb': round(size / 1024, 2)
                 }
-            else:
-                return {'exists': False, 'status_code': response.status_code}
         except Exception as e:
             return {'exists': False, 'error': str(e)}
 
@@ -250,7 +595,7 @@ class BlogAutomation:
         robots_url = f"{self.site_url}/robots.txt"
         
         try:
-            response = requests.get(robots_url)
+            response = self.http.get(robots_url)
             return {
                 'exists': response.status_code == 200,
                 'content': response.text if response.status_code == 200 else None,
@@ -262,17 +607,16 @@ class BlogAutomation:
     def analyze_meta_tags(self) -> Dict[str, Any]:
         """메타 태그 분석"""
         try:
-            response = requests.get(self.site_url)
-            html_content = response.text
+            hits = self._scan_meta_markers(self._get_homepage().content)
             
             # 기본 메타 태그 확인
             meta_analysis = {
-                'has_title': '<title>' in html_content,
-                'has_description': 'name="description"' in html_content,
-                'has_keywords': 'name="keywords"' in html_content,
-                'has_og_tags': 'property="og:' in html_content,
-                'has_twitter_cards': 'name="twitter:' in html_content,
-                'has_canonical': 'rel="canonical"' in html_content
+                'has_title': hits['has_title'],
+                'has_description': hits['has_description'],
+                'has_keywords': hits['has_keywords'],
+                'has_og_tags': hits['has_og_tags'],
+                'has_twitter_cards': hits['has_twitter_cards'],
+                'has_canonical': hits['has_canonical']
             }
             
             return meta_analysis
@@ -283,17 +627,30 @@ class BlogAutomation:
     def check_structured_data(self) -> Dict[str, Any]:
         """구조화된 데이터 확인"""
         try:
-            response = requests.get(self.site_url)
-            html_content = response.text
+            hits = self._scan_meta_markers(self._get_homepage().content)
             
             return {
-                'has_json_ld': 'application/ld+json' in html_content,
-                'has_microdata': 'itemscope' in html_content,
-                'has_rdfa': 'typeof=' in html_content
+                'has_json_ld': hits['has_json_ld'],
+                'has_microdata': hits['has_microdata'],
+                'has_rdfa': hits['has_rdfa']
             }
         except Exception as e:
             return {'error': str(e)}
 
+    def _scan_meta_markers(self, html_bytes: bytes) -> Dict[str, bool]:
+        """HTML을 한 번 스캔하여 각 메타 표식의 존재 여부 반환"""
+        hits = dict.fromkeys(self._META_RE.groupindex, False)
+        remaining = len(hits)
+        
+        for match in self._META_RE.finditer(html_bytes):
+            if not hits[match.lastgroup]:
+                hits[match.lastgroup] = True
+                remaining -= 1
+                if remaining == 0:
+                    break
+        
+        return hits
+
     def check_internal_links(self) -> Dict[str, Any]:
         """내부 링크 확인"""
         try:
@@ -318,36 +675,113 @@ class BlogAutomation:
         }
         
         # _posts 디렉토리의 모든 포스트 확인
-        if self.posts_dir.exists():
-            for post_file in self.posts_dir.glob('*.md'):
-                try:
-                    with open(post_file, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                        
-                    # Front matter에서 title 추출
-                    if content.startswith('---'):
-                        front_matter = content.split('---')[1]
-                        front_matter_data = yaml.safe_load(front_matter)
-                        title = front_matter_data.get('title')
-                        
-                        if title:
-                            titles_analysis['post_titles'].append({
-                                'file': post_file.name,
-                                'title': title,
-                                'length': len(title)
-                            })
-                        else:
-                            titles_analysis['missing_titles'].append(post_file.name)
-                            
-                except Exception as e:
-                    logger.warning(f"⚠️ Error analyzing {post_file}: {e}")
+        for post_file, front_matter_data, _ in self._iter_posts():
+            if front_matter_data is None:
+                continue
+            
+            try:
+                # Front matter에서 title 추출
+                title = front_matter_data.get('title')
+                
+                if title:
+                    titles_analysis['post_titles'].append({
+                        'file': post_file.name,
+                        'title': title,
+                        'length': len(title)
+                    })
+                else:
+                    titles_analysis['missing_titles'].append(post_file.name)
+                    
+            except Exception as e:
+                logger.warning(f"⚠️ Error analyzing {post_file}: {e}")
         
         # 중복 제목 찾기
         titles = [item['title'] for item in titles_analysis['post_titles']]
-        titles_analysis['duplicate_titles'] = list(set([title for title in titles if titles.count(title) > 1]))
+        titles_analysis['duplicate_titles'] = [title for title, count in Counter(titles).items() if count > 1]
         
         return titles_analysis
 
+    def _iter_posts(self, with_body: bool = False) -> Iterator[Tuple[Path, Optional[Dict[str, Any]], Optional[bytes]]]:
+        """포스트별 (파일, front matter, 본문) 순회 - (경로, mtime) 기준으로 캐시
+        
+        with_body=False 이면 front matter 블록만 읽고 본문은 None
+        """
+        if not self._stat_cache.exists(self.posts_dir):
+            return
+        
+        post_files = list(self.posts_dir.glob('*.md'))
+        if not post_files:
+            return
+        
+        # 파일 I/O 동안 GIL이 해제되므로 스레드 풀로 병렬 로드
+        max_workers = min(32, (os.cpu_count() or 1) * 4, len(post_files))
+        load_post = partial(self._load_post, with_body=with_body)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(load_post, post_files, chunksize=8))
+        
+        yield from results
+
+    def _load_post(self, post_file: Path, with_body: bool = False) -> Tuple[Path, Optional[Dict[str, Any]], Optional[bytes]]:
+        """캐시를 확인하고 변경된 포스트만 다시 파싱"""
+        try:
+            mtime = post_file.stat().st_mtime
+            cached = self._post_cache.get(post_file)
+            if (cached is None or cached[0] != mtime
+                    or (with_body and cached[1] is not None and cached[2] is None)):
+                cached = (mtime, *self._parse_post(post_file, with_body))
+                self._post_cache[post_file] = cached
+        except Exception as e:
+            logger.warning(f"⚠️ Error reading {post_file}: {e}")
+            return post_file, None, None
+        
+        return post_file, cached[1], cached[2]
+
+    def _parse_post(self, post_file: Path, with_body: bool = True) -> Tuple[Optional[Dict[str, Any]], Optional[bytes]]:
+        """포스트 파일에서 front matter와 본문(bytes) 분리"""
+        if not with_body:
+            front_matter = self._read_front_matter(post_file)
+            if front_matter is None:
+                return None, None
+            return self._load_front_matter(front_matter), None
+        
+        with open(post_file, 'rb') as f:
+            content = f.read()
+        
+        match = self._FM_RE.match(content)
+        if not match:
+            return None, None
+        
+        front_matter_data = self._load_front_matter(match.group(1))
+        return front_matter_data, content[match.end():]
+
+    @staticmethod
+    def _load_front_matter(front_matter: bytes) -> Dict[str, Any]:
+        """front matter YAML 파싱 - 매핑이 아니면(리스트, 스칼라) ValueError"""
+        data = _yload(front_matter)
+        if data is None:
+            return {}
+        if not isinstance(data, dict):
+            raise ValueError(f"front matter is not a mapping: {type(data).__name__}")
+        return data
+
+    def _read_front_matter(self, post_file: Path, chunk_size: int = 4096) -> Optional[bytes]:
+        """닫는 '---' 까지만 읽어 front matter 블록 반환 (긴 본문은 읽지 않음)"""
+        with open(post_file, 'rb') as f:
+            buf = f.read(chunk_size)
+            if not buf.startswith(b'---'):
+                return None
+            
+            while True:
+                match = self._FM_RE.match(buf)
+                if match and match.end() < len(buf):
+                    return match.group(1)
+                
+                # 버퍼를 두 배씩 늘려가며 닫는 구분자 탐색
+                chunk = f.read(len(buf))
+                if not chunk:
+                    return match.group(1) if match else None
+                buf += chunk
+
     def check_content_integrity(self) -> Dict[str, Any]:
         """콘텐츠 무결성 확인"""
         logger.info("📝 Checking content integrity...")
@@ -371,33 +805,28 @@ class BlogAutomation:
             'recent_posts': 0  # 최근 30일
         }
         
-        if self.posts_dir.exists():
-            recent_date = datetime.now() - timedelta(days=30)
+        recent_date = datetime.now() - timedelta(days=30)
+        
+        for post_file, front_matter_data, _ in self._iter_posts():
+            counts['total_posts'] += 1
             
-            for post_file in self.posts_dir.glob('*.md'):
-                counts['total_posts'] += 1
+            if front_matter_data is None:
+                continue
+            
+            try:
+                # 발행 상태 확인
+                if not front_matter_data.get('draft', False):
+                    counts['published_posts'] += 1
+                else:
+                    counts['draft_posts'] += 1
                 
-                try:
-                    with open(post_file, 'r', encoding='utf-8') as f:
-                        content = f.read()
+                # 최근 포스트 확인
+                post_date = front_matter_data.get('date')
+                if post_date and isinstance(post_date, datetime) and post_date > recent_date:
+                    counts['recent_posts'] += 1
                     
-                    if content.startswith('---'):
-                        front_matter = content.split('---')[1]
-                        front_matter_data = yaml.safe_load(front_matter)
-                        
-                        # 발행 상태 확인
-                        if not front_matter_data.get('draft', False):
-                            counts['published_posts'] += 1
-                        else:
-                            counts['draft_posts'] += 1
-                        
-                        # 최근 포스트 확인
-                        post_date = front_matter_data.get('date')
-                        if post_date and isinstance(post_date, datetime) and post_date > recent_date:
-                            counts['recent_posts'] += 1
-                            
-                except Exception as e:
-                    logger.warning(f"⚠️ Error reading {post_file}: {e}")
+            except Exception as e:
+                logger.warning(f"⚠️ Error reading {post_file}: {e}")
         
         return counts
 
@@ -411,70 +840,93 @@ class BlogAutomation:
             'missing_alt_text': []
         }
         
-        if self.images_dir.exists():
-            for img_file in self.images_dir.rglob('*'):
-                if img_file.is_file() and img_file.suffix.lower() in ['.jpg', '.jpeg', '.png', '.gif', '.webp']:
-                    image_analysis['total_images'] += 1
-                    
-                    # 파일 크기 확인
-                    file_size = img_file.stat().st_size
-                    image_analysis['total_size_mb'] += file_size / (1024 * 1024)
-                    
-                    if file_size > 1024 * 1024:  # 1MB 이상
-                        image_analysis['large_images'].append({
-                            'file': str(img_file.relative_to(self.base_dir)),
-                            'size_mb': round(file_size / (1024 * 1024), 2)
-                        })
-                    
-                    # 이미지 최적화 가능성 확인
-                    if img_file.suffix.lower() in ['.png', '.jpg', '.jpeg']:
-                        try:
-                            with Image.open(img_file) as img:
-                                if img.mode == 'RGBA' and img_file.suffix.lower() in ['.jpg', '.jpeg']:
-                                    image_analysis['unoptimized_images'].append(str(img_file.relative_to(self.base_dir)))
-                        except Exception:
-                            pass
+        if self._stat_cache.exists(self.images_dir):
+            for entry, ext, file_stat in self._walk_images(self.images_dir):
+                image_analysis['total_images'] += 1
+                rel_path = os.path.relpath(entry.path, self.base_dir)
+                
+                # 파일 크기 확인
+                file_size = file_stat.st_size
+                image_analysis['total_size_mb'] += file_size / (1024 * 1024)
+                
+                if file_size > 1024 * 1024:  # 1MB 이상
+                    image_analysis['large_images'].append({
+                        'file': rel_path,
+                        'size_mb': round(file_size / (1024 * 1024), 2)
+                    })
+                
+                # 이미지 최적화 가능성 확인 - 확장자는 JPEG인데 실제로는 알파 채널이 있는 PNG인 파일
+                # (이미지 전체를 디코딩하지 않고 PNG IHDR 헤더만 읽음)
+                if ext in ('jpg', 'jpeg'):
+                    try:
+                        if _png_has_alpha(entry.path):
+                            image_analysis['unoptimized_images'].append(rel_path)
+                    except OSError:
+                        pass
         
         image_analysis['total_size_mb'] = round(image_analysis['total_size_mb'], 2)
         return image_analysis
 
+    def _walk_images(self, root: Path) -> Iterator[Tuple[os.DirEntry, str, os.stat_result]]:
+        """이미지 파일 재귀 탐색 - (DirEntry, 확장자, stat) 반환
+        
+        os.scandir의 DirEntry가 파일 종류와 stat을 캐시하므로 파일당 stat 호출이 한 번뿐
+        """
+        for entry in _iter_files(root):
+            _, dot, ext = entry.name.rpartition('.')
+            ext = ext.lower()
+            if dot and ext in self._IMAGE_EXTS:
+                yield entry, ext, entry.stat()
+
     def find_broken_links(self) -> List[str]:
         """깨진 링크 찾기"""
-        broken_links = []
+        # (파일, 링크, 정상 여부) - 절대 경로 링크는 요청 후 결정되므로 None
+        link_checks: List[Tuple[Path, str, Optional[bool]]] = []
         
-        # 모든 마크다운 파일에서 링크 추출 및 확인
+        # 1단계: 모든 마크다운 파일에서 링크 추출 (상대 경로는 바로 확인)
         for md_file in self.base_dir.rglob('*.md'):
             try:
                 with open(md_file, 'r', encoding='utf-8') as f:
                     content = f.read()
                 
                 # 마크다운 링크 패턴 찾기
-                import re
-                links = re.findall(r'\[([^\]]+)\]\(([^)]+)\)', content)
+                links = _MD_LINK_RE.findall(content)
                 
                 for link_text, link_url in links:
                     if link_url.startswith('http'):
                         # 외부 링크는 건너뛰기 (시간이 오래 걸림)
                         continue
                     elif link_url.startswith('/'):
-                        # 절대 경로 링크 확인
-                        full_url = f"{self.site_url}{link_url}"
-                        try:
-                            response = requests.head(full_url, timeout=5)
-                            if response.status_code >= 400:
-                                broken_links.append(f"{md_file}: {link_url}")
-                        except:
-                            broken_links.append(f"{md_file}: {link_url}")
+                        # 절대 경로 링크는 중복 제거 후 한꺼번에 확인
+                        link_checks.append((md_file, link_url, None))
                     else:
                         # 상대 경로 링크 확인
                         link_path = md_file.parent / link_url
-                        if not link_path.exists():
-                            broken_links.append(f"{md_file}: {link_url}")
+                        link_checks.append((md_file, link_url, link_path.exists()))
                             
             except Exception as e:
                 logger.warning(f"⚠️ Error checking links in {md_file}: {e}")
         
-        return broken_links
+        # 2단계: 고유한 절대 경로 링크를 세션 공유 스레드 풀로 동시에 HEAD 요청
+        unique_urls = list(dict.fromkeys(link_url for _, link_url, ok in link_checks if ok is None))
+        url_status: Dict[str, bool] = {}
+        if unique_urls:
+            with ThreadPoolExecutor(max_workers=min(16, len(unique_urls))) as executor:
+                url_status = dict(zip(unique_urls, executor.map(self._check_internal_url, unique_urls)))
+        
+        return [
+            f"{md_file}: {link_url}"
+            for md_file, link_url, ok in link_checks
+            if not (url_status[link_url] if ok is None else ok)
+        ]
+
+    def _check_internal_url(self, link_url: str) -> bool:
+        """사이트 내부 절대 경로 링크가 정상 응답하는지 확인"""
+        try:
+            response = self.http.head(f"{self.site_url}{link_url}", timeout=5)
+            return response.status_code < 400
+        except Exception:
+            return False
 
     def find_missing_assets(self) -> List[str]:
         """누락된 에셋 찾기"""
@@ -504,39 +956,32 @@ class BlogAutomation:
             'readability_scores': []
         }
         
-        if self.posts_dir.exists():
-            total_words = 0
-            post_count = 0
-            
-            for post_file in self.posts_dir.glob('*.md'):
-                try:
-                    with open(post_file, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                    
-                    if content.startswith('---'):
-                        parts = content.split('---', 2)
-                        if len(parts) >= 3:
-                            front_matter_data = yaml.safe_load(parts[1])
-                            post_content = parts[2]
-                            
-                            # 태그 확인
-                            if not front_matter_data.get('tags'):
-                                quality_metrics['posts_without_tags'].append(post_file.name)
-                            
-                            # 설명 확인
-                            if not front_matter_data.get('description'):
-                                quality_metrics['posts_without_description'].append(post_file.name)
-                            
-                            # 단어 수 계산
-                            word_count = len(post_content.split())
-                            total_words += word_count
-                            post_count += 1
-                            
-                except Exception as e:
-                    logger.warning(f"⚠️ Error analyzing content quality for {post_file}: {e}")
+        total_words = 0
+        post_count = 0
+        
+        for post_file, front_matter_data, post_content in self._iter_posts(with_body=True):
+            if front_matter_data is None or post_content is None:
+                continue
             
-            if post_count > 0:
-                quality_metrics['avg_post_length'] = round(total_words / post_count)
+            try:
+                # 태그 확인
+                if not front_matter_data.get('tags'):
+                    quality_metrics['posts_without_tags'].append(post_file.name)
+                
+                # 설명 확인
+                if not front_matter_data.get('description'):
+                    quality_metrics['posts_without_description'].append(post_file.name)
+                
+                # 단어 수 계산
+                word_count = sum(1 for _ in self._WORD_RE.finditer(post_content))
+                total_words += word_count
+                post_count += 1
+                
+            except Exception as e:
+                logger.warning(f"⚠️ Error analyzing content quality for {post_file}: {e}")
+        
+        if post_count > 0:
+            quality_metrics['avg_post_length'] = round(total_words / post_count)
         
         return quality_metrics
 
@@ -556,7 +1001,7 @@ class BlogAutomation:
     def check_security_headers(self) -> Dict[str, Any]:
         """보안 헤더 확인"""
         try:
-            response = requests.get(self.site_url)
+            response = self._get_homepage()
             headers = response.headers
             
             security_headers = {
@@ -597,34 +1042,46 @@ class BlogAutomation:
             'config/secrets.yml'
         ]
         
+        # 패턴마다 트리를 다시 순회하지 않고 한 번의 순회에서 모든 패턴 확인
+        name_patterns = [p for p in sensitive_patterns if '/' not in p]
+        path_suffixes = tuple('/' + p for p in sensitive_patterns if '/' in p)
+        base = os.fspath(self.base_dir)
+        
         sensitive_files = []
-        for pattern in sensitive_patterns:
-            for file_path in self.base_dir.rglob(pattern):
-                if file_path.is_file():
-                    sensitive_files.append(str(file_path.relative_to(self.base_dir)))
+        for entry in _iter_files(base):
+            rel_path = os.path.relpath(entry.path, base)
+            if (any(fnmatchcase(entry.name, p) for p in name_patterns)
+                    or ('/' + rel_path.replace(os.sep, '/')).endswith(path_suffixes)):
+                sensitive_files.append(rel_path)
         
         return sensitive_files
 
+    def _jekyll_command(self, *args: str) -> List[str]:
+        """Jekyll 실행 명령 - JEKYLL_BIN 환경변수가 있으면 bundle exec 없이 직접 실행"""
+        jekyll_bin = os.getenv('JEKYLL_BIN')
+        base_cmd = shlex.split(jekyll_bin) if jekyll_bin else ['bundle', 'exec', 'jekyll']
+        return [*base_cmd, *args]
+
     def check_build_status(self) -> Dict[str, Any]:
         """빌드 상태 확인"""
         logger.info("🔨 Checking build status...")
         
         try:
             # Jekyll 빌드 테스트
-            result = subprocess.run(['bundle', 'exec', 'jekyll', 'build', '--dry-run'], 
+            result = subprocess.run(self._jekyll_command('build', '--dry-run'), 
                                   capture_output=True, text=True, timeout=60)
             
             return {
                 'build_successful': result.returncode == 0,
                 'output': result.stdout,
                 'errors': result.stderr if result.returncode != 0 else None,
-                'build_time': datetime.now().isoformat()
+                'build_time': self._now_iso()
             }
         except Exception as e:
             return {
                 'build_successful': False,
                 'error': str(e),
-                'build_time': datetime.now().isoformat()
+                'build_time': self._now_iso()
             }
 
     def calculate_health_score(self, health_report: Dict[str, Any]) -> int:
@@ -677,16 +1134,16 @@ class BlogAutomation:
         report_file = self.automation_dir / f"health_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
         
         try:
-            with open(report_file, 'w', encoding='utf-8') as f:
-                json.dump(health_report, f, indent=2, ensure_ascii=False, default=str)
+            _write_json(report_file, health_report)
             
             logger.info(f"📊 Health report saved: {report_file}")
             
-            # 최신 보고서 링크 생성
+            # 최신 보고서 링크 생성 (임시 링크를 만든 뒤 원자적으로 교체)
             latest_report = self.automation_dir / 'latest_health_report.json'
-            if latest_report.exists():
-                latest_report.unlink()
-            latest_report.symlink_to(report_file.name)
+            tmp_link = latest_report.with_name(f".{latest_report.name}.{os.getpid()}.tmp")
+            tmp_link.unlink(missing_ok=True)
+            os.symlink(report_file.name, tmp_link)
+            os.replace(tmp_link, latest_report)
             
         except Exception as e:
             logger.error(f"❌ Failed to save health report: {e}")
@@ -703,46 +1160,46 @@ class BlogAutomation:
             'errors': []
         }
         
-        if not self.images_dir.exists():
+        if not self._stat_cache.exists(self.images_dir):
             logger.warning("⚠️ Images directory not found")
             return optimization_report
         
-        for img_file in self.images_dir.rglob('*'):
-            if img_file.is_file() and img_file.suffix.lower() in ['.jpg', '.jpeg', '.png']:
-                try:
-                    original_size = img_file.stat().st_size
-                    optimization_report['total_size_before'] += original_size
-                    
-                    # 이미지 최적화
-                    with Image.open(img_file) as img:
-                        # EXIF 데이터 제거 및 최적화
-                        if img.mode in ('RGBA', 'LA'):
-                            # PNG로 저장 (투명도 유지)
-                            img.save(img_file, 'PNG', optimize=True)
-                        else:
-                            # JPEG로 저장
-                            if img.mode != 'RGB':
-                                img = img.convert('RGB')
-                            img.save(img_file, 'JPEG', quality=quality, optimize=True)
-                    
-                    new_size = img_file.stat().st_size
-                    optimization_report['total_size_after'] += new_size
-                    optimization_report['processed_images'] += 1
-                    
-                    if new_size < original_size:
-                        optimization_report['optimized_files'].append({
-                            'file': str(img_file.relative_to(self.base_dir)),
-                            'size_before': original_size,
-                            'size_after': new_size,
-                            'savings_percent': round((1 - new_size/original_size) * 100, 1)
-                        })
-                    
-                except Exception as e:
-                    optimization_report['errors'].append({
-                        'file': str(img_file.relative_to(self.base_dir)),
-                        'error': str(e)
-                    })
-                    logger.error(f"❌ Error optimizing {img_file}: {e}")
+        image_paths = [
+            entry.path for entry, ext, _ in self._walk_images(self.images_dir)
+            if ext in self._OPTIMIZABLE_EXTS
+        ]
+        
+        # 인코딩은 CPU 바운드이므로 프로세스 풀로 코어 수만큼 병렬 처리
+        results = []
+        if image_paths:
+            with ProcessPoolExecutor() as executor:
+                results = list(executor.map(partial(_optimize_one, quality=quality), image_paths, chunksize=4))
+            self._stat_cache.invalidate(self.images_dir)
+        
+        for result in results:
+            rel_path = os.path.relpath(result['path'], self.base_dir)
+            original_size = result['size_before']
+            optimization_report['total_size_before'] += original_size
+            
+            if 'error' in result:
+                optimization_report['errors'].append({
+                    'file': rel_path,
+                    'error': result['error']
+                })
+                logger.error(f"❌ Error optimizing {result['path']}: {result['error']}")
+                continue
+            
+            new_size = result['size_after']
+            optimization_report['total_size_after'] += new_size
+            optimization_report['processed_images'] += 1
+            
+            if new_size < original_size:
+                optimization_report['optimized_files'].append({
+                    'file': rel_path,
+                    'size_before': original_size,
+                    'size_after': new_size,
+                    'savings_percent': round((1 - new_size/original_size) * 100, 1)
+                })
         
         # 통계 계산
         if optimization_report['total_size_before'] > 0:
@@ -758,9 +1215,13 @@ class BlogAutomation:
         logger.info("💾 Starting content backup...")
         
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        backup_dir = self.automation_dir / 'backups' / timestamp
+        backup_root = self.automation_dir / 'backups'
+        backup_dir = backup_root / timestamp
         backup_dir.mkdir(parents=True, exist_ok=True)
         
+        # 직전 백업 - 변경되지 않은 파일은 여기에 하드링크하여 데이터 복사를 생략
+        previous_backup = self._find_previous_backup(backup_root, timestamp)
+        
         backup_report = {
             'timestamp': timestamp,
             'backup_location': str(backup_dir),
@@ -781,29 +1242,29 @@ class BlogAutomation:
             ('index.md', 'Home page')
         ]
         
-        for item, description in backup_items:
-            source_path = self.base_dir / item
+        # 크기 합계는 바이트 정수로 누적하고 MB 변환은 마지막에 한 번만
+        total_bytes = 0
+        
+        # 항목별 복사는 I/O 바운드이므로 스레드 풀로 동시에 실행
+        with ThreadPoolExecutor(max_workers=min(8, len(backup_items))) as executor:
+            futures = [
+                executor.submit(self._backup_item, item, backup_dir, previous_backup)
+                for item, _ in backup_items
+            ]
             
-            if source_path.exists():
+            # 보고서 순서를 유지하기 위해 제출 순서대로 결과 수집
+            for (item, description), future in zip(backup_items, futures):
                 try:
-                    if source_path.is_file():
-                        # 파일 백업
-                        dest_path = backup_dir / item
-                        dest_path.parent.mkdir(parents=True, exist_ok=True)
-                        shutil.copy2(source_path, dest_path)
-                        size = source_path.stat().st_size
-                    else:
-                        # 디렉토리 백업
-                        dest_path = backup_dir / item
-                        shutil.copytree(source_path, dest_path, dirs_exist_ok=True)
-                        size = sum(f.stat().st_size for f in source_path.rglob('*') if f.is_file())
+                    size = future.result()
+                    if size is None:
+                        continue
                     
                     backup_report['backed_up_items'].append({
                         'item': item,
                         'description': description,
                         'size_mb': round(size / (1024 * 1024), 2)
                     })
-                    backup_report['total_size_mb'] += size / (1024 * 1024)
+                    total_bytes += size
                     
                 except Exception as e:
                     backup_report['errors'].append({
@@ -812,43 +1273,75 @@ class BlogAutomation:
                     })
                     logger.error(f"❌ Error backing up {item}: {e}")
         
-        backup_report['total_size_mb'] = round(backup_report['total_size_mb'], 2)
+        # 새로 쓴 백업 경로는 캐시에서 제거
+        self._stat_cache.invalidate(backup_dir)
+        
+        backup_report['total_size_mb'] = round(total_bytes / (1024 * 1024), 2)
         
         # 백업 보고서 저장
         report_file = backup_dir / 'backup_report.json'
         try:
-            with open(report_file, 'w', encoding='utf-8') as f:
-                json.dump(backup_report, f, indent=2, ensure_ascii=False, default=str)
+            _write_json(report_file, backup_report)
         except Exception as e:
             logger.error(f"❌ Failed to save backup report: {e}")
         
         logger.info(f"✅ Backup complete: {len(backup_report['backed_up_items'])} items backed up")
         return backup_report
 
+    def _find_previous_backup(self, backup_root: Path, timestamp: str) -> Optional[Path]:
+        """지금 백업보다 앞선 가장 최근 백업 디렉토리"""
+        previous = [
+            entry.path for entry in os.scandir(backup_root)
+            if entry.is_dir(follow_symlinks=False) and entry.name < timestamp
+        ]
+        return Path(max(previous)) if previous else None
+
+    def _backup_item(self, item: str, backup_dir: Path, previous_backup: Optional[Path] = None) -> Optional[int]:
+        """백업 항목 하나를 복사하고 크기(바이트) 반환 - 원본이 없으면 None"""
+        source_path = self.base_dir / item
+        try:
+            # stat 한 번으로 존재 여부, 종류, 크기를 모두 확인
+            source_stat = self._stat_cache.stat(source_path)
+        except FileNotFoundError:
+            return None
+        
+        dest_path = backup_dir / item
+        reference = previous_backup / item if previous_backup else None
+        
+        if not stat.S_ISDIR(source_stat.st_mode):
+            # 파일 백업
+            dest_path.parent.mkdir(parents=True, exist_ok=True)
+            _link_or_copy(source_path, dest_path, source_stat, reference)
+            return source_stat.st_size
+        
+        # 디렉토리 백업 - 복사와 크기 계산을 한 번의 순회로 처리
+        return _copy_tree(source_path, dest_path, reference)
+
     def generate_sitemap(self) -> Dict[str, Any]:
         """사이트맵 생성"""
         logger.info("🗺️ Generating sitemap...")
         
         try:
-            # Jekyll 빌드를 통해 사이트맵 생성
-            result = subprocess.run(['bundle', 'exec', 'jekyll', 'build'], 
+            # Jekyll 빌드를 통해 사이트맵 생성 (증분 빌드로 변경된 페이지만 다시 렌더링)
+            result = subprocess.run(self._jekyll_command('build', '--incremental'), 
                                   capture_output=True, text=True, timeout=120)
             
             if result.returncode == 0:
-                sitemap_file = self.base_dir / '_site' / 'sitemap.xml'
-                if sitemap_file.exists():
-                    # 사이트맵 통계
-                    with open(sitemap_file, 'r', encoding='utf-8') as f:
-                        sitemap_content = f.read()
-                    
-                    import xml.etree.ElementTree as ET
-                    root = ET.fromstring(sitemap_content)
-                    url_count = len(root.findall('.//{http://www.sitemaps.org/schemas/sitemap/0.9}url'))
+                site_dir = self.base_dir / '_site'
+                self._stat_cache.invalidate(site_dir)
+                sitemap_file = site_dir / 'sitemap.xml'
+                if self._stat_cache.exists(sitemap_file):
+                    # 사이트맵 통계 (파일을 스트리밍 파싱하여 URL 개수 확인)
+                    url_count = 0
+                    for _, elem in ET.iterparse(sitemap_file, events=('end',)):
+                        if elem.tag == SITEMAP_URL_TAG:
+                            url_count += 1
+                            elem.clear()
                     
                     return {
                         'success': True,
                         'url_count': url_count,
-                        'file_size': sitemap_file.stat().st_size,
+                        'file_size': self._stat_cache.stat(sitemap_file).st_size,
                         'generated_at': datetime.now().isoformat()
                     }
                 else:
@@ -908,8 +1401,7 @@ class BlogAutomation:
         # 자동화 보고서 저장
         report_file = self.automation_dir / f"automation_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
         try:
-            with open(report_file, 'w', encoding='utf-8') as f:
-                json.dump(automation_report, f, indent=2, ensure_ascii=False, default=str)
+            _write_json(report_file, automation_report)
         except Exception as e:
             logger.error(f"❌ Failed to save automation report: {e}")
         
@@ -6,6 +6,7 @@ AI 자동 콘텐츠 생성기
 """
 
 import os
+import re
 import openai
 import datetime
 import random
@@ -14,6 +15,10 @@ import requests
 from pathlib import Path
 
 class AIContentGenerator:
+    # slugify용 정규식 (호출마다 컴파일하지 않도록 미리 준비)
+    _SLUG_STRIP = re.compile(r'[^\w\s-]')
+    _SLUG_DASH = re.compile(r'[-\s]+')
+
     def __init__(self):
         self.api_key = os.getenv('OPENAI_API_KEY')
         if not self.api_key:
@@ -129,10 +134,9 @@ class AIContentGenerator:
     
     def slugify(self, text):
         """한글 제목을 URL 친화적으로 변환"""
-        import re
         # 특수문자 제거 및 공백을 하이픈으로
-        slug = re.sub(r'[^\w\s-]', '', text)
-        slug = re.sub(r'[-\s]+', '-', slug)
+        slug = self._SLUG_STRIP.sub('', text)
+        slug = self._SLUG_DASH.sub('-', slug)
         return slug.strip('-').lower()[:50]  # 50자 제한
     
     def update_stats(self):
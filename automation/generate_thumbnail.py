@@ -1,27 +1,29 @@
 from PIL import Image, ImageDraw, ImageFont
-import requests
-from io import BytesIO
+from concurrent.futures import ThreadPoolExecutor
 
-def download_logo(team_id):
-    url = f"https://www.mlbstatic.com/team-logos/{team_id}.svg"
-    png_url = f"https://www.mlbstatic.com/team-logos/{team_id}.png"
-    r = requests.get(png_url)
-    return Image.open(BytesIO(r.content)).convert("RGBA")
+# 로고 다운로드(공유 세션 + 디스크 캐시 + 220x220 축소)는 MLB 자동 포스트와 같은 구현 사용
+from mlb_common import load_logo
+
+# 배경과 폰트는 한 번만 만들고 썸네일마다 복사해서 사용
+BACKGROUND = Image.new("RGB", (1200, 630), (10, 20, 40))
+FONT = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 80)
 
 def create_thumbnail(home_id, away_id, home_score, away_score, filename):
-    width, height = 1200, 630
-    bg = Image.new("RGB", (width, height), (10, 20, 40))
+    bg = BACKGROUND.copy()
+
+    # 두 팀 로고를 동시에 다운로드 (다운로드 실패 시 None)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        home_logo, away_logo = executor.map(load_logo, (home_id, away_id))
 
-    home_logo = download_logo(home_id).resize((220,220))
-    away_logo = download_logo(away_id).resize((220,220))
+    if home_logo:
+        bg.paste(home_logo, (200,200), home_logo)
 
-    bg.paste(home_logo, (200,200), home_logo)
-    bg.paste(away_logo, (780,200), away_logo)
+    if away_logo:
+        bg.paste(away_logo, (780,200), away_logo)
 
     draw = ImageDraw.Draw(bg)
-    font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 80)
 
     score_text = f"{away_score} : {home_score}"
-    draw.text((470, 250), score_text, font=font, fill="white")
+    draw.text((470, 250), score_text, font=FONT, fill="white")
 
-    bg.save(filename)
+    bg.save(filename, optimize=True)
@@ -1,192 +1,110 @@
-import requests
 from datetime import datetime
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 import os
-from PIL import Image, ImageDraw, ImageFont
-from io import BytesIO
+import threading
+from urllib.parse import quote
+import json
+import hashlib
 
-# =========================
-# MLB API 설정
-# =========================
-
-MLB_API = "https://statsapi.mlb.com/api/v1/schedule?sportId=1&date={date}&hydrate=linescore,boxscore"
-
-LOGO_URL = "https://www.mlbstatic.com/team-logos/{team_id}.svg"
-
-
-# =========================
-# 오늘 경기 데이터 수집
-# =========================
-
-def get_games():
-    today = datetime.utcnow().strftime("%Y-%m-%d")
-    url = MLB_API.format(date=today)
-
-    res = requests.get(url)
-    data = res.json()
-
-    games = []
-
-    for date in data.get("dates", []):
-        for g in date.get("games", []):
-
-            status = g["status"]["detailedState"]
-
-            # 경기 종료된 경기만
-            if status != "Final":
-                continue
-
-            game_data = {
-                "home": g["teams"]["home"]["team"]["name"],
-                "away": g["teams"]["away"]["team"]["name"],
-                "home_score": g["teams"]["home"]["score"],
-                "away_score": g["teams"]["away"]["score"],
-                "home_id": g["teams"]["home"]["team"]["id"],
-                "away_id": g["teams"]["away"]["team"]["id"],
-                "boxscore": g.get("boxscore", {}),
-            }
+from mlb_common import get_games, fetch_logos, create_thumbnail, calculate_mvp
 
-            games.append(game_data)
+# 직전 실행의 경기 상태 해시 (변경이 없으면 포스트를 다시 만들지 않음)
+STATE_HASH_FILE = Path("automation/.cache/last_state.hash")
 
-    return games
+# 직전 실행의 일정 응답 ETag (조건부 요청으로 변경 없는 일정은 받지 않음)
+SCHEDULE_ETAG_FILE = Path("automation/.cache/schedule.etag")
 
-
-# =========================
-# 팀 로고 다운로드
-# =========================
-
-def download_logo(team_id):
-    try:
-        url = f"https://www.mlbstatic.com/team-logos/{team_id}.png"
-        res = requests.get(url, timeout=10)
-        return Image.open(BytesIO(res.content)).convert("RGBA")
-    except:
-        return None
+# 포스트된 파일 이름 목록 (한 줄에 하나) - 매 실행 _posts 전체를 읽지 않도록 함
+POSTED_INDEX = Path("_posts/.index")
+POSTED_INDEX_LOCK = threading.Lock()
 
 
 # =========================
-# ESPN 스타일 썸네일 생성
+# 경기 상태 해시
 # =========================
 
-def create_thumbnail(game, date_str):
-
-    width, height = 1280, 720
-    img = Image.new("RGB", (width, height), "#0b0f14")
-    draw = ImageDraw.Draw(img)
-
-    # 상단 ESPN 스타일 바
-    draw.rectangle((0, 0, width, 80), fill="#e10600")
-
-    try:
-        font_big = ImageFont.truetype("DejaVuSans-Bold.ttf", 140)
-        font_mid = ImageFont.truetype("DejaVuSans-Bold.ttf", 60)
-        font_small = ImageFont.truetype("DejaVuSans-Bold.ttf", 36)
-    except:
-        font_big = font_mid = font_small = ImageFont.load_default()
-
-    away_logo = download_logo(game["away_id"])
-    home_logo = download_logo(game["home_id"])
+def games_state_hash(games):
+    """경기 상태(경기 ID, 상태, 점수)의 SHA-256 해시"""
+    state = sorted(
+        (g["game_id"], g["status"], g["home_score"], g["away_score"]) for g in games
+    )
+    return hashlib.sha256(json.dumps(state).encode()).hexdigest()
 
-    if away_logo:
-        away_logo.thumbnail((220, 220))
-        img.paste(away_logo, (140, 240), away_logo)
 
-    if home_logo:
-        home_logo.thumbnail((220, 220))
-        img.paste(home_logo, (920, 240), home_logo)
+def save_run_state(state_hash, etag):
+    """다음 실행에서 비교할 경기 상태 해시와 일정 ETag 기록"""
+    STATE_HASH_FILE.parent.mkdir(parents=True, exist_ok=True)
+    STATE_HASH_FILE.write_text(state_hash)
 
-    # 팀명
-    draw.text((260, 260), game["away"].upper(), font=font_mid, fill="white")
-    draw.text((720, 260), game["home"].upper(), font=font_mid, fill="white")
-
-    # 점수 강조
-    score_text = f'{game["away_score"]} : {game["home_score"]}'
-    draw.text((420, 360), score_text, font=font_big, fill="#ffd700")
-
-    draw.text((20, 20), "MLB SPRING TRAINING", font=font_small, fill="white")
-    draw.text((950, 20), date_str, font=font_small, fill="white")
-
-    path = f"assets/images/{date_str}-{game['away']}-vs-{game['home']}.png"
-    os.makedirs("assets/images", exist_ok=True)
-    img.save(path, quality=95)
-
-    return path
+    if etag:
+        SCHEDULE_ETAG_FILE.write_text(etag)
 
 
 # =========================
-# MVP 자동 계산
+# 블로그 포스트 생성
 # =========================
 
-def calculate_mvp(game):
-
-    players = []
+def post_name(game, date_str):
+    return f"{date_str}-{game['away']}-vs-{game['home']}.md"
 
-    for team in game.get("boxscore", {}).get("teams", {}).values():
-        for player in team.get("players", {}).values():
 
-            # 타자
-            batting = player.get("stats", {}).get("batting", {})
-            hits = batting.get("hits", 0)
-            hr = batting.get("homeRuns", 0)
-            rbi = batting.get("rbi", 0)
+def posted_names():
+    """이미 포스트된 파일 이름 집합
 
-            score = hits + hr * 3 + rbi * 2
+    인덱스 파일 하나만 읽고, 인덱스가 없을 때만 _posts를 한 번 스캔해서 인덱스를 만듦
+    (main()이 시작할 때 _posts를 만들어 두므로 존재 여부는 다시 확인하지 않음)
+    """
+    if POSTED_INDEX.exists():
+        return set(POSTED_INDEX.read_text(encoding="utf-8").splitlines())
 
-            if score > 0:
-                players.append((player["person"]["fullName"], score))
+    with os.scandir("_posts") as it:
+        names = {entry.name for entry in it if entry.is_file(follow_symlinks=False)}
 
-            # 투수
-            pitching = player.get("stats", {}).get("pitching", {})
-            wins = pitching.get("wins", 0)
-            saves = pitching.get("saves", 0)
-            strikeouts = pitching.get("strikeOuts", 0)
+    POSTED_INDEX.write_text("".join(f"{name}\n" for name in sorted(names)), encoding="utf-8")
+    return names
 
-            score = wins * 5 + saves * 4 + strikeouts
 
-            if score > 0:
-                players.append((player["person"]["fullName"], score))
+def add_posted(name):
+    with POSTED_INDEX_LOCK, open(POSTED_INDEX, "a", encoding="utf-8") as f:
+        f.write(f"{name}\n")
 
-    if not players:
-        return None
 
-    return max(players, key=lambda x: x[1])[0]
-
-
-# =========================
-# 블로그 포스트 생성
-# =========================
-
-def create_post(game, thumbnail):
-
-    date_str = datetime.now().strftime("%Y-%m-%d")
-
-    mvp = calculate_mvp(game)
-
-    title = f"{game['away']} vs {game['home']} 경기 결과"
-
-    content = f"""---
+POST_TEMPLATE = """---
 layout: post
-title: "{title}"
+title: "{away} vs {home} 경기 결과"
 date: {date_str}
 categories: mlb
-image: /{thumbnail}
+image: /{image}
 ---
 
 ## ⚾ 경기 결과
-**{game['away']} {game['away_score']} - {game['home_score']} {game['home']}**
+**{away} {away_score} - {home_score} {home}**
 
+{mvp_line}
+---
+MLB 시범경기 자동 업데이트
 """
 
-    if mvp:
-        content += f"\n🏆 **MVP: {mvp}**\n"
 
-    content += "\n---\nMLB 시범경기 자동 업데이트\n"
+def create_post(game, thumbnail, date_str):
 
-    filename = f"_posts/{date_str}-{game['away']}-vs-{game['home']}.md"
-    os.makedirs("_posts", exist_ok=True)
+    mvp = calculate_mvp(game)
 
+    content = POST_TEMPLATE.format_map({
+        **game,
+        "date_str": date_str,
+        "image": quote(thumbnail),
+        "mvp_line": f"\n🏆 **MVP: {mvp}**\n" if mvp else "",
+    })
+
+    name = post_name(game, date_str)
+    filename = f"_posts/{name}"
     with open(filename, "w", encoding="utf-8") as f:
         f.write(content)
 
+    add_posted(name)
+
     return filename
 
 
@@ -198,7 +116,12 @@ def main():
 
     print("🔍 경기 종료 데이터 확인 중...")
 
-    games = get_games()
+    etag = SCHEDULE_ETAG_FILE.read_text().strip() if SCHEDULE_ETAG_FILE.exists() else None
+    games, etag = get_games(etag)
+
+    if games is None:
+        print("⏭️ 직전 실행 이후 일정 변경 없음")
+        return
 
     if not games:
         print("❌ 종료된 경기 없음")
@@ -206,13 +129,45 @@ def main():
 
     print(f"✅ 종료 경기 수: {len(games)}")
 
+    state_hash = games_state_hash(games)
+    if STATE_HASH_FILE.exists() and STATE_HASH_FILE.read_text().strip() == state_hash:
+        print("⏭️ 직전 실행 이후 변경된 경기 없음")
+        save_run_state(state_hash, etag)
+        return
+
     date_str = datetime.now().strftime("%Y-%m-%d")
 
-    for game in games:
+    # 출력 디렉토리는 실행당 한 번만 생성 (경기마다 makedirs 하지 않음)
+    os.makedirs("_posts", exist_ok=True)
+    os.makedirs("assets/images", exist_ok=True)
+
+    # 더블헤더는 포스트/썸네일 경로가 같으므로 경로당 한 경기만 남김 (여러 스레드가 같은 파일에 동시에 쓰지 않도록)
+    # 경기를 차례로 처리하며 덮어쓰던 때와 같은 결과가 되도록 마지막 경기를 사용
+    by_name = {post_name(game, date_str): game for game in games}
+
+    # 이미 포스트가 있는 경기는 건너뜀
+    posted = posted_names()
+    eligible = [game for name, game in by_name.items() if name not in posted]
+    if len(eligible) < len(by_name):
+        print(f"⏭️ 이미 포스트된 경기: {len(by_name) - len(eligible)}")
+
+    # 모든 경기의 로고를 한 번에 미리 받아둠 (경기마다 2회씩 순차 요청하지 않도록)
+    logos = fetch_logos(
+        team_id for game in eligible for team_id in (game["away_id"], game["home_id"])
+    )
+
+    def publish(game):
         print(f"⚾ 포스트 생성: {game['away']} vs {game['home']}")
 
-        thumbnail = create_thumbnail(game, date_str)
-        create_post(game, thumbnail)
+        thumbnail = create_thumbnail(game, date_str, logos)
+        create_post(game, thumbnail, date_str)
+
+    # 경기별 썸네일 인코딩과 파일 쓰기는 서로 독립적이므로 동시에 처리
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(publish, eligible))
+
+    # 모든 포스트를 만든 뒤에만 상태를 기록 (중간에 실패하면 다음 실행에서 다시 시도)
+    save_run_state(state_hash, etag)
 
     print("🚀 블로그 포스트 생성 완료")
 
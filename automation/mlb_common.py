@@ -0,0 +1,269 @@
+"""MLB 자동 포스트/썸네일 스크립트 공용 모듈 (HTTP 세션, 경기 데이터, 로고, 썸네일)"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from datetime import datetime, timezone
+from email.utils import formatdate
+from pathlib import Path
+import os
+import time
+from PIL import Image, ImageDraw, ImageFont
+from io import BytesIO
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+# orjson이 있으면 일정 JSON 파싱에 사용 (표준 json 대비 수 배 빠름)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# =========================
+# MLB API 설정
+# =========================
+
+# linescore는 사용하지 않으므로 boxscore(MVP 계산용)만 요청
+MLB_API = "https://statsapi.mlb.com/api/v1/schedule?sportId=1&date={date}&hydrate=boxscore"
+
+LOGO_URL = "https://www.mlbstatic.com/team-logos/{team_id}.svg"
+
+# 공유 HTTP 세션 (keep-alive로 요청마다 TCP/TLS 연결을 새로 맺지 않음, 일시적 5xx는 재시도)
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504]),
+))
+
+# 팀 로고 디스크 캐시 (30개 팀 로고는 거의 바뀌지 않음)
+LOGO_CACHE_DIR = Path("automation/.cache/logos")
+LOGO_CACHE_TTL = 7 * 24 * 60 * 60  # 7일
+
+# 썸네일/로고 크기
+THUMB_WIDTH, THUMB_HEIGHT = 1280, 720
+LOGO_SIZE = (220, 220)
+
+
+# =========================
+# 오늘 경기 데이터 수집
+# =========================
+
+def game_data(g):
+    return {
+        "game_id": g["gamePk"],
+        "status": g["status"]["detailedState"],
+        "home": g["teams"]["home"]["team"]["name"],
+        "away": g["teams"]["away"]["team"]["name"],
+        "home_score": g["teams"]["home"]["score"],
+        "away_score": g["teams"]["away"]["score"],
+        "home_id": g["teams"]["home"]["team"]["id"],
+        "away_id": g["teams"]["away"]["team"]["id"],
+        "boxscore": g.get("boxscore", {}),
+    }
+
+
+def get_games(etag=None):
+    """오늘 종료된 경기 목록과 응답 ETag
+
+    직전 ETag를 넘기면 조건부 요청을 보내고, 일정이 바뀌지 않았으면(304) 경기 목록 대신 None 반환
+    """
+    today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    url = MLB_API.format(date=today)
+
+    headers = {"If-None-Match": etag} if etag else {}
+    res = SESSION.get(url, headers=headers, timeout=10)
+
+    if res.status_code == 304:
+        return None, etag
+
+    res.raise_for_status()
+    data = orjson.loads(res.content) if orjson is not None else res.json()
+
+    # 경기 종료된 경기만
+    games = [
+        game_data(g)
+        for date in data.get("dates", [])
+        for g in date.get("games", [])
+        if g["status"]["detailedState"] == "Final"
+    ]
+
+    return games, res.headers.get("ETag")
+
+
+# =========================
+# 팀 로고 다운로드
+# =========================
+
+def open_logo(fp):
+    """로고를 RGBA로 열기 (mlbstatic PNG는 대부분 이미 RGBA라 변환 복사 생략)"""
+    img = Image.open(fp)
+    img.load()
+    if img.mode != "RGBA":
+        img = img.convert("RGBA")
+    return img
+
+
+def download_logo(team_id):
+    try:
+        cache_file = LOGO_CACHE_DIR / f"{team_id}.png"
+        etag_file = cache_file.with_suffix(".etag")
+        headers = {}
+
+        if cache_file.exists():
+            cached_at = cache_file.stat().st_mtime
+
+            # TTL 이내면 요청 없이 캐시 사용
+            if time.time() - cached_at < LOGO_CACHE_TTL:
+                return open_logo(cache_file)
+
+            # 만료된 캐시는 조건부 요청으로 재검증 (변경 없으면 304, 본문 없음)
+            headers["If-Modified-Since"] = formatdate(cached_at, usegmt=True)
+            if etag_file.exists():
+                headers["If-None-Match"] = etag_file.read_text().strip()
+
+        url = f"https://www.mlbstatic.com/team-logos/{team_id}.png"
+        res = SESSION.get(url, headers=headers, timeout=10)
+
+        if res.status_code == 304:
+            cache_file.touch()
+            return open_logo(cache_file)
+
+        res.raise_for_status()
+
+        # 임시 파일에 쓴 뒤 교체하여 깨진 캐시 파일이 남지 않도록 함
+        LOGO_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix(".tmp")
+        tmp_file.write_bytes(res.content)
+        os.replace(tmp_file, cache_file)
+
+        if res.headers.get("ETag"):
+            etag_file.write_text(res.headers["ETag"])
+
+        return open_logo(BytesIO(res.content))
+    except:
+        return None
+
+
+def load_logo(team_id):
+    """썸네일 크기로 축소한 팀 로고"""
+    logo = download_logo(team_id)
+    if logo:
+        logo.thumbnail(LOGO_SIZE, Image.LANCZOS)
+    return logo
+
+
+def fetch_logos(team_ids):
+    """중복을 제거한 팀 로고를 동시에 다운로드 → {team_id: Image | None}
+
+    팀당 한 번만 축소해 두므로 썸네일 생성 시에는 읽기만 함 (스레드 간 공유 가능)
+    """
+    team_ids = list(dict.fromkeys(team_ids))
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        return dict(zip(team_ids, executor.map(load_logo, team_ids)))
+
+
+# =========================
+# ESPN 스타일 썸네일 생성
+# =========================
+
+@lru_cache(maxsize=None)
+def get_fonts():
+    """(큰, 중간, 작은) 폰트 - 처음 사용할 때 프로세스당 한 번만 로드"""
+    try:
+        return (
+            ImageFont.truetype("DejaVuSans-Bold.ttf", 140),
+            ImageFont.truetype("DejaVuSans-Bold.ttf", 60),
+            ImageFont.truetype("DejaVuSans-Bold.ttf", 36),
+        )
+    except:
+        font = ImageFont.load_default()
+        return font, font, font
+
+
+@lru_cache(maxsize=None)
+def get_template():
+    """경기와 무관한 배경 + 상단 바 + 타이틀을 미리 그려둔 템플릿 (처음 사용할 때 한 번만 생성)"""
+    _, _, font_small = get_fonts()
+
+    img = Image.new("RGB", (THUMB_WIDTH, THUMB_HEIGHT), "#0b0f14")
+    draw = ImageDraw.Draw(img)
+
+    # 상단 ESPN 스타일 바
+    draw.rectangle((0, 0, THUMB_WIDTH, 80), fill="#e10600")
+    draw.text((20, 20), "MLB SPRING TRAINING", font=font_small, fill="white")
+
+    return img
+
+
+def create_thumbnail(game, date_str, logos):
+
+    font_big, font_mid, font_small = get_fonts()
+
+    img = get_template().copy()
+    draw = ImageDraw.Draw(img)
+
+    away_logo = logos.get(game["away_id"])
+    home_logo = logos.get(game["home_id"])
+
+    if away_logo:
+        img.paste(away_logo, (140, 240), away_logo)
+
+    if home_logo:
+        img.paste(home_logo, (920, 240), home_logo)
+
+    # 팀명
+    draw.text((260, 260), game["away"].upper(), font=font_mid, fill="white")
+    draw.text((720, 260), game["home"].upper(), font=font_mid, fill="white")
+
+    # 점수 강조
+    score_text = f'{game["away_score"]} : {game["home_score"]}'
+    draw.text((420, 360), score_text, font=font_big, fill="#ffd700")
+
+    draw.text((950, 20), date_str, font=font_small, fill="white")
+
+    path = f"assets/images/{date_str}-{game['away']}-vs-{game['home']}.png"
+    # quality는 PNG에 적용되지 않음 - 최대 압축으로 저장 (화질 손실 없음)
+    img.save(path, "PNG", optimize=True, compress_level=9)
+
+    return path
+
+
+# =========================
+# MVP 자동 계산
+# =========================
+
+def calculate_mvp(game):
+
+    players = []
+
+    for team in game.get("boxscore", {}).get("teams", {}).values():
+        for player in team.get("players", {}).values():
+
+            # 타자
+            batting = player.get("stats", {}).get("batting", {})
+            hits = batting.get("hits", 0)
+            hr = batting.get("homeRuns", 0)
+            rbi = batting.get("rbi", 0)
+
+            score = hits + hr * 3 + rbi * 2
+
+            if score > 0:
+                players.append((player["person"]["fullName"], score))
+
+            # 투수
+            pitching = player.get("stats", {}).get("pitching", {})
+            wins = pitching.get("wins", 0)
+            saves = pitching.get("saves", 0)
+            strikeouts = pitching.get("strikeOuts", 0)
+
+            score = wins * 5 + saves * 4 + strikeouts
+
+            if score > 0:
+                players.append((player["person"]["fullName"], score))
+
+    if not players:
+        return None
+
+    return max(players, key=lambda x: x[1])[0]